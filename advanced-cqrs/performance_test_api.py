@@ -3,8 +3,11 @@
 Script de pruebas de rendimiento para aplicación CQRS
 Inserciones siguen el flujo:
   Post → Comment → Reaction (se mide principalmente el endpoint de Reaction)
+La carga es determinista (semilla fija) y se graba en una traza reproducible con workload_trace.py
 """
 
+import os
+import sys
 import requests
 import time
 import csv
@@ -13,17 +16,23 @@ from datetime import datetime
 import random
 import string
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from workload_trace import TraceRecorder
+
 # Configuración
 API_BASE_URL = "http://localhost:8085"
 NUM_OPERATIONS = 50
+RANDOM_SEED = 42
 
 class PerformanceTest:
-    def __init__(self):
+    def __init__(self, recorder):
         self.results = []
         self.post_ids = []
+        self.rng = random.Random(RANDOM_SEED)
+        self.recorder = recorder
 
     def generate_random_content(self, length=50):
-        return ''.join(random.choices(string.ascii_letters + string.digits + ' ', k=length))
+        return ''.join(self.rng.choices(string.ascii_letters + string.digits + ' ', k=length))
 
     def test_reaction_insertion(self, operation_number):
         start_time = time.perf_counter()
@@ -33,18 +42,30 @@ class PerformanceTest:
         try:
             # 1. Crear Post
             post_data = {"content": self.generate_random_content()}
+            issued_at = time.perf_counter()
             post_resp = requests.post(f"{API_BASE_URL}/post", json=post_data, timeout=10)
             post_id = post_resp.json().get("id")
             self.post_ids.append(post_id)
+            self.recorder.record('INSERT_POST', 'POST', "/post", body=post_data,
+                                 status_code=post_resp.status_code, resolved_id=post_id, issued_at=issued_at)
 
             # 2. Crear Comment
             comment_data = {"author": "Tester", "content": self.generate_random_content(20)}
+            issued_at = time.perf_counter()
             comment_resp = requests.post(f"{API_BASE_URL}/post/{post_id}/comment", json=comment_data, timeout=10)
             comment_id = comment_resp.json().get("id")
+            self.recorder.record('INSERT_COMMENT', 'POST', "/post/{postId}/comment", ids={"postId": post_id},
+                                 body=comment_data, status_code=comment_resp.status_code,
+                                 resolved_id=comment_id, issued_at=issued_at)
 
             # 3. Crear Reaction
-            reaction_data = {"type": random.choice(["LIKE", "LOVE", "HAHA", "WOW"]), "user": f"user_{operation_number}"}
+            reaction_data = {"emoji": self.rng.choice(["LIKE", "LOVE", "HAHA", "WOW"]), "user": f"user_{operation_number}"}
+            issued_at = time.perf_counter()
             reaction_resp = requests.post(f"{API_BASE_URL}/post/{post_id}/comment/{comment_id}/reaction", json=reaction_data, timeout=10)
+            self.recorder.record('INSERT_REACTION', 'POST', "/post/{postId}/comment/{commentId}/reaction",
+                                 ids={"postId": post_id, "commentId": comment_id}, body=reaction_data,
+                                 status_code=reaction_resp.status_code,
+                                 resolved_id=reaction_resp.json().get("id"), issued_at=issued_at)
 
             end_time = time.perf_counter()
             duration_ms = (end_time - start_time) * 1000
@@ -85,6 +106,8 @@ class PerformanceTest:
             status_code = -1
             error_message = str(e)[:100]
 
+        self.recorder.record('QUERY_POST', 'GET', "/post/{postId}", ids={"postId": post_id},
+                             status_code=status_code, issued_at=start_time)
         return {
             'operation_type': 'QUERY',
             'operation_number': operation_number,
@@ -110,7 +133,7 @@ class PerformanceTest:
         available_ids = self.post_ids.copy()
 
         for i in range(NUM_OPERATIONS):
-            post_id = random.choice(available_ids) if available_ids else str(random.randint(1, 1000))
+            post_id = self.rng.choice(available_ids) if available_ids else str(self.rng.randint(1, 1000))
             result = self.test_post_query(post_id, i + 1)
             self.results.append(result)
             print(f"  Consulta {i+1} (ID {post_id}): {result['duration_ms']:.2f}ms - {'✓' if result['success'] else '✗'}")
@@ -221,12 +244,17 @@ class PerformanceTest:
         return filename
 
 def main():
-    test = PerformanceTest()
-    test.run_insertion_tests()
-    test.run_query_tests()
+    trace_file = f"workload_trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz"
+    recorder = TraceRecorder(trace_file, "advanced-cqrs/performance_test_api.py", API_BASE_URL, RANDOM_SEED)
+    test = PerformanceTest(recorder)
+    try:
+        test.run_insertion_tests()
+        test.run_query_tests()
+    finally:
+        recorder.close()
     csv_file = test.save_csv_results()
     stats_file = test.calculate_and_save_statistics()
-    print(f"\n✅ Pruebas completadas\nArchivos generados:\n  - {csv_file}\n  - {stats_file}")
+    print(f"\n✅ Pruebas completadas\nArchivos generados:\n  - {csv_file}\n  - {stats_file}\n  - {trace_file}")
 
 if __name__ == "__main__":
     main()
@@ -8,7 +8,9 @@ import com.danielblanco.arquitecturasmodernas.cqrs.advanced.command.repository.P
 import com.danielblanco.arquitecturasmodernas.cqrs.advanced.command.repository.ReactionCommandRepository;
 import java.util.Date;
 import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.http.HttpStatus;
 import org.springframework.stereotype.Service;
+import org.springframework.web.server.ResponseStatusException;
 
 @Service
 public class CommandService {
@@ -34,6 +36,11 @@ public class CommandService {
   }
 
   public ReactionCommand addReaction(Long postId, Long commentId, ReactionCommand reaction) {
+    String emoji = reaction.getEmoji();
+    // El emoji se usa como nombre de campo del contador en el modelo de lectura
+    if (emoji == null || emoji.isEmpty() || emoji.contains(".") || emoji.startsWith("$")) {
+      throw new ResponseStatusException(HttpStatus.BAD_REQUEST);
+    }
     CommentCommand comment = new CommentCommand();
     comment.setId(commentId);
     reaction.setComment(comment);
@@ -6,6 +6,7 @@ import java.util.List;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.web.bind.annotation.GetMapping;
 import org.springframework.web.bind.annotation.PathVariable;
+import org.springframework.web.bind.annotation.RequestParam;
 import org.springframework.web.bind.annotation.RestController;
 
 @RestController
@@ -15,12 +16,13 @@ public class MongoController {
   private QueryService queryService;
 
   @GetMapping("/post/{id}")
-  public Post getPost(@PathVariable String id) {
-    return queryService.getPost(id);
+  public Post getPost(@PathVariable String id,
+      @RequestParam(defaultValue = "false") boolean includeReactions) {
+    return queryService.getPost(id, includeReactions);
   }
 
   @GetMapping("/posts")
-  public List<Post> getAllPosts() {
-    return queryService.getAllPosts();
+  public List<Post> getAllPosts(@RequestParam(defaultValue = "false") boolean includeReactions) {
+    return queryService.getAllPosts(includeReactions);
   }
 }
@@ -1,12 +1,17 @@
 package com.danielblanco.arquitecturasmodernas.cqrs.advanced.query.model;
 
+import com.fasterxml.jackson.annotation.JsonInclude;
+import java.util.HashMap;
 import java.util.List;
+import java.util.Map;
 
 public class Comment {
 
   private String id;
   private String content;
+  @JsonInclude(JsonInclude.Include.NON_NULL)
   private List<Reaction> reactions;
+  private Map<String, Long> reactionCounts = new HashMap<>();
 
   public String getId() {
     return id;
@@ -31,4 +36,12 @@ public class Comment {
   public void setReactions(List<Reaction> reactions) {
     this.reactions = reactions;
   }
+
+  public Map<String, Long> getReactionCounts() {
+    return reactionCounts;
+  }
+
+  public void setReactionCounts(Map<String, Long> reactionCounts) {
+    this.reactionCounts = reactionCounts != null ? reactionCounts : new HashMap<>();
+  }
 }
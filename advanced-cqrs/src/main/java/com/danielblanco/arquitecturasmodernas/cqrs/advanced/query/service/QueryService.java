@@ -1,9 +1,17 @@
 package com.danielblanco.arquitecturasmodernas.cqrs.advanced.query.service;
 
+import com.danielblanco.arquitecturasmodernas.cqrs.advanced.query.model.Comment;
 import com.danielblanco.arquitecturasmodernas.cqrs.advanced.query.model.Post;
-import com.danielblanco.arquitecturasmodernas.cqrs.advanced.query.repository.PostRepository;
+import com.danielblanco.arquitecturasmodernas.cqrs.advanced.query.model.Reaction;
+import java.util.ArrayList;
 import java.util.List;
+import java.util.Map;
+import java.util.Objects;
+import java.util.stream.Collectors;
 import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.data.mongodb.core.MongoOperations;
+import org.springframework.data.mongodb.core.query.Criteria;
+import org.springframework.data.mongodb.core.query.Query;
 import org.springframework.http.HttpStatus;
 import org.springframework.stereotype.Service;
 import org.springframework.web.server.ResponseStatusException;
@@ -12,13 +20,43 @@ import org.springframework.web.server.ResponseStatusException;
 public class QueryService {
 
   @Autowired
-  PostRepository postRepository;
+  private MongoOperations mongoOps;
 
-  public Post getPost(String id) {
-    return postRepository.findById(id).orElseThrow(() -> new ResponseStatusException(HttpStatus.NOT_FOUND));
+  public Post getPost(String id, boolean includeReactions) {
+    Post post = mongoOps.findOne(new Query(Criteria.where("id").is(id)), Post.class);
+    if (post == null) {
+      throw new ResponseStatusException(HttpStatus.NOT_FOUND);
+    }
+    if (includeReactions) {
+      attachReactions(List.of(post));
+    }
+    return post;
   }
 
-  public List<Post> getAllPosts() {
-    return postRepository.findAll();
+  public List<Post> getAllPosts(boolean includeReactions) {
+    List<Post> posts = mongoOps.findAll(Post.class);
+    if (includeReactions) {
+      attachReactions(posts);
+    }
+    return posts;
+  }
+
+  // Por defecto solo se devuelven los contadores por emoji; las reacciones completas se leen de su colección
+  private void attachReactions(List<Post> posts) {
+    List<Comment> comments = posts.stream()
+        .map(Post::getComments)
+        .filter(Objects::nonNull)
+        .flatMap(List::stream)
+        .collect(Collectors.toList());
+    if (comments.isEmpty()) {
+      return;
+    }
+    List<String> commentIds = comments.stream().map(Comment::getId).collect(Collectors.toList());
+    Map<String, List<Reaction>> reactionsByComment = mongoOps
+        .find(new Query(Criteria.where("commentId").in(commentIds)), Reaction.class)
+        .stream().collect(Collectors.groupingBy(Reaction::getCommentId));
+    for (Comment comment : comments) {
+      comment.setReactions(reactionsByComment.getOrDefault(comment.getId(), new ArrayList<>()));
+    }
   }
 }
@@ -9,8 +9,11 @@ import com.danielblanco.arquitecturasmodernas.cqrs.advanced.command.repository.R
 import com.danielblanco.arquitecturasmodernas.cqrs.advanced.query.model.Comment;
 import com.danielblanco.arquitecturasmodernas.cqrs.advanced.query.model.Post;
 import com.danielblanco.arquitecturasmodernas.cqrs.advanced.query.model.Reaction;
+import com.mongodb.client.result.UpdateResult;
 import java.util.Date;
 import java.util.List;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.data.mongodb.core.FindAndModifyOptions;
 import org.springframework.data.mongodb.core.MongoOperations;
@@ -22,6 +25,8 @@ import org.springframework.stereotype.Service;
 @Service
 public class SyncService {
 
+  private static final Logger log = LoggerFactory.getLogger(SyncService.class);
+
   Date lastSyncDate = new Date();
 
   @Autowired
@@ -73,15 +78,27 @@ public class SyncService {
     List<ReactionCommand> modifiedReactions = reactionCommandRepository.findAllByLastModifiedDateAfter(lastSyncDate);
 
     for(ReactionCommand reaction : modifiedReactions) {
+      // Solo la primera sincronización de una reacción la inserta, así el contador no se incrementa dos veces
+      Update insertReaction = new Update()
+          .setOnInsert("emoji", reaction.getEmoji())
+          .setOnInsert("commentId", reaction.getCommentId().toString());
+      UpdateResult inserted = mongoOps.upsert(new Query(Criteria.where("id").is(reaction.getId().toString())),
+          insertReaction, Reaction.class);
+      if (inserted.getUpsertedId() == null) {
+        continue;
+      }
       Query query = new Query(new Criteria().andOperator(
           Criteria.where("id").is(reaction.getComment().getPostId().toString()),
           Criteria.where("comments").elemMatch(Criteria.where("id").is(reaction.getCommentId().toString()))
       ));
-      Reaction mongoReaction = new Reaction();
-      mongoReaction.setId(reaction.getId().toString());
-      mongoReaction.setEmoji(reaction.getEmoji());
-      Update update = new Update().addToSet("comments.$.reactions", mongoReaction);
-      mongoOps.findAndModify(query, update, FindAndModifyOptions.options().upsert(true), Post.class);
+      Update update = new Update().inc("comments.$.reactionCounts." + reaction.getEmoji(), 1L);
+      UpdateResult counted = mongoOps.updateFirst(query, update, Post.class);
+      if (counted.getMatchedCount() == 0) {
+        // El comentario aún no está en el modelo de lectura: se deshace la inserción para reintentarlo
+        mongoOps.remove(new Query(Criteria.where("id").is(reaction.getId().toString())), Reaction.class);
+        log.warn("Comment {} not found in read model, reaction {} will be retried on next sync",
+            reaction.getCommentId(), reaction.getId());
+      }
     }
   }
 }
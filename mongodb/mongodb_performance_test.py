@@ -4,8 +4,11 @@ Script de prueba de rendimiento para API REST (MongoController en localhost:8085
 Realiza 50 inserciones de reacciones (usando post+comment+reaction) y 50 consultas,
 midiendo el tiempo de cada operación.
 Genera un archivo CSV con los resultados y un archivo TXT con estadísticas.
+La carga es determinista (semilla fija) y se graba en una traza reproducible con workload_trace.py
 """
 
+import os
+import sys
 import time
 import csv
 import statistics
@@ -13,13 +16,19 @@ import random
 import requests
 from datetime import datetime
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from workload_trace import TraceRecorder
+
 # Configuración de conexión a la API
 BASE_URL = "http://localhost:8085"
+RANDOM_SEED = 42
+
+# Los ids los genera el servidor; así dos ejecuciones con la misma semilla emiten el mismo tráfico
+rng = random.Random(RANDOM_SEED)
 
 def generate_random_post(index):
     """Genera un post aleatorio"""
     return {
-        "id": f"post_{index}_{int(time.time())}_{random.randint(1000,9999)}",
         "title": f"Post de prueba {index}",
         "content": f"Contenido aleatorio del post {index}"
     }
@@ -27,7 +36,6 @@ def generate_random_post(index):
 def generate_random_comment(index):
     """Genera un comentario aleatorio"""
     return {
-        "id": f"comment_{index}_{int(time.time())}_{random.randint(1000,9999)}",
         "author": f"Autor{index}",
         "content": f"Comentario de prueba {index}"
     }
@@ -36,12 +44,11 @@ def generate_random_reaction(index):
     """Genera una reacción aleatoria"""
     reaction_types = ["LIKE", "LOVE", "HAHA", "WOW", "SAD", "ANGRY"]
     return {
-        "id": f"reaction_{index}_{int(time.time())}_{random.randint(1000,9999)}",
-        "type": random.choice(reaction_types),
-        "user": f"user{random.randint(1,100)}"
+        "emoji": rng.choice(reaction_types),
+        "user": f"user{rng.randint(1,100)}"
     }
 
-def run_performance_test():
+def run_performance_test(recorder):
     insert_times = []
     query_times = []
     reaction_refs = []  # Lista de (postId, commentId, reactionId)
@@ -54,32 +61,45 @@ def run_performance_test():
     for i in range(50):
         # Crear post
         post = generate_random_post(i+1)
+        issued_at = time.perf_counter()
         r_post = requests.post(f"{BASE_URL}/post", json=post)
+        post_id = r_post.json().get("id") if r_post.status_code == 200 else None
+        recorder.record('INSERT_POST', 'POST', "/post", body=post, status_code=r_post.status_code,
+                        resolved_id=post_id, issued_at=issued_at)
         if r_post.status_code != 200:
             print(f"Error creando post {i+1}: {r_post.status_code}")
             continue
 
         # Crear comentario
         comment = generate_random_comment(i+1)
-        r_comment = requests.post(f"{BASE_URL}/post/{post['id']}/comment", json=comment)
+        issued_at = time.perf_counter()
+        r_comment = requests.post(f"{BASE_URL}/post/{post_id}/comment", json=comment)
+        comment_id = r_comment.json().get("id") if r_comment.status_code == 200 else None
+        recorder.record('INSERT_COMMENT', 'POST', "/post/{postId}/comment", ids={"postId": post_id},
+                        body=comment, status_code=r_comment.status_code, resolved_id=comment_id,
+                        issued_at=issued_at)
         if r_comment.status_code != 200:
             print(f"Error creando comentario {i+1}: {r_comment.status_code}")
             continue
 
         # Crear reacción (esta es la operación medida)
         reaction = generate_random_reaction(i+1)
-        start_time = time.time()
+        start_time = time.perf_counter()
         r_reaction = requests.post(
-            f"{BASE_URL}/post/{post['id']}/comment/{comment['id']}/reaction",
+            f"{BASE_URL}/post/{post_id}/comment/{comment_id}/reaction",
             json=reaction
         )
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         duration_ms = (end_time - start_time) * 1000
         insert_times.append(duration_ms)
 
+        reaction_id = r_reaction.json().get("id") if r_reaction.status_code == 200 else None
+        recorder.record('INSERT_REACTION', 'POST', "/post/{postId}/comment/{commentId}/reaction",
+                        ids={"postId": post_id, "commentId": comment_id}, body=reaction,
+                        status_code=r_reaction.status_code, resolved_id=reaction_id, issued_at=start_time)
         if r_reaction.status_code == 200:
-            reaction_refs.append((post["id"], comment["id"], reaction["id"]))
+            reaction_refs.append((post_id, comment_id, reaction_id))
         else:
             print(f"Error creando reacción {i+1}: {r_reaction.status_code} {r_reaction.text}")
 
@@ -91,14 +111,16 @@ def run_performance_test():
         if not reaction_refs:
             break
 
-        postId, _, _ = random.choice(reaction_refs)
+        postId, _, _ = rng.choice(reaction_refs)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         r_get = requests.get(f"{BASE_URL}/post/{postId}")
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         duration_ms = (end_time - start_time) * 1000
         query_times.append(duration_ms)
+        recorder.record('QUERY_POST', 'GET', "/post/{postId}", ids={"postId": postId},
+                        status_code=r_get.status_code, issued_at=start_time)
 
         if r_get.status_code != 200:
             print(f"Error consultando post {postId}: {r_get.status_code} {r_get.text}")
@@ -109,6 +131,7 @@ def run_performance_test():
     print("\n--- GENERANDO ARCHIVOS DE RESULTADOS ---")
     generate_csv_file(insert_times, query_times)
     generate_stats_file(insert_times, query_times)
+    print(f"Traza de carga generada: {recorder.filename}")
 
     print("\n=== TEST COMPLETADO ===")
 
@@ -164,9 +187,13 @@ def generate_stats_file(insert_times, query_times):
     
 if __name__ == "__main__":
     print("Script de prueba de rendimiento API (usando addReaction)")
+    recorder = TraceRecorder(f"workload_trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz",
+                             "mongodb/mongodb_performance_test.py", BASE_URL, RANDOM_SEED)
     try:
-        run_performance_test()
+        run_performance_test(recorder)
     except KeyboardInterrupt:
         print("\nTest interrumpido por el usuario")
     except Exception as e:
         print(f"Error durante el test: {e}")
+    finally:
+        recorder.close()
@@ -9,6 +9,7 @@ import org.springframework.web.bind.annotation.GetMapping;
 import org.springframework.web.bind.annotation.PathVariable;
 import org.springframework.web.bind.annotation.PostMapping;
 import org.springframework.web.bind.annotation.RequestBody;
+import org.springframework.web.bind.annotation.RequestParam;
 import org.springframework.web.bind.annotation.RestController;
 
 @RestController
@@ -18,8 +19,9 @@ public class MongoController {
   private MongoService mongoService;
 
   @GetMapping("/post/{id}")
-  public Post getPost(@PathVariable String id) {
-    return mongoService.getPost(id);
+  public Post getPost(@PathVariable String id,
+      @RequestParam(defaultValue = "false") boolean includeReactions) {
+    return mongoService.getPost(id, includeReactions);
   }
 
   @PostMapping("/post")
@@ -0,0 +1,89 @@
+package com.danielblanco.arquitecturasmodernas.cqrs.mongo.migration;
+
+import com.danielblanco.arquitecturasmodernas.cqrs.mongo.model.Reaction;
+import com.mongodb.client.MongoCollection;
+import com.mongodb.client.model.Aggregates;
+import com.mongodb.client.model.Filters;
+import com.mongodb.client.model.MergeOptions;
+import com.mongodb.client.model.Updates;
+import java.util.List;
+import org.bson.Document;
+import org.bson.conversions.Bson;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.beans.factory.InitializingBean;
+import org.springframework.data.domain.Sort;
+import org.springframework.data.mongodb.core.MongoTemplate;
+import org.springframework.data.mongodb.core.index.Index;
+import org.springframework.stereotype.Component;
+
+// Migra los posts con reacciones embebidas: las copia a su colección, calcula reactionCounts y
+// las quita del post. Es idempotente y se ejecuta antes de que el servidor web acepte peticiones.
+@Component
+public class ReactionMigration implements InitializingBean {
+
+  private static final Logger log = LoggerFactory.getLogger(ReactionMigration.class);
+
+  private static final Bson EMBEDDED_REACTIONS = Filters.exists("comments.reactions");
+
+  private final MongoTemplate mongoTemplate;
+
+  public ReactionMigration(MongoTemplate mongoTemplate) {
+    this.mongoTemplate = mongoTemplate;
+  }
+
+  @Override
+  public void afterPropertiesSet() {
+    mongoTemplate.indexOps(Reaction.class).ensureIndex(new Index().on("commentId", Sort.Direction.ASC));
+
+    MongoCollection<Document> posts = mongoTemplate.getCollection("posts");
+    long pending = posts.countDocuments(EMBEDDED_REACTIONS);
+    if (pending == 0) return;
+
+    log.info("Migrating embedded reactions of {} posts...", pending);
+    long startTime = System.currentTimeMillis();
+
+    // 1. Copia las reacciones a su colección (las que ya existen se dejan como están)
+    posts.aggregate(List.of(
+        Aggregates.match(EMBEDDED_REACTIONS),
+        Aggregates.unwind("$comments"),
+        Aggregates.unwind("$comments.reactions"),
+        Aggregates.project(new Document("_id", ifNull("$comments.reactions._id", "$comments.reactions.id"))
+            .append("emoji", "$comments.reactions.emoji")
+            .append("commentId", ifNull("$comments._id", "$comments.id"))),
+        Aggregates.merge(mongoTemplate.getCollectionName(Reaction.class), new MergeOptions()
+            .whenMatched(MergeOptions.WhenMatched.KEEP_EXISTING)
+            .whenNotMatched(MergeOptions.WhenNotMatched.INSERT))
+    )).toCollection();
+
+    // 2. Recalcula los contadores por emoji de cada comentario a partir de la lista embebida
+    posts.updateMany(EMBEDDED_REACTIONS, List.of(new Document("$set", new Document("comments",
+        new Document("$map", new Document("input", "$comments").append("as", "c")
+            .append("in", new Document("$mergeObjects", List.of("$$c",
+                new Document("reactionCounts", reactionCounts("$$c.reactions"))))))))));
+
+    // 3. Quita las listas embebidas, así el post deja de crecer
+    posts.updateMany(EMBEDDED_REACTIONS, Updates.unset("comments.$[].reactions"));
+
+    long endTime = System.currentTimeMillis();
+    log.info("Reaction migration completed: {} posts in {} ms", pending, (endTime - startTime));
+  }
+
+  // {emoji: número de reacciones} a partir de una lista de reacciones
+  private static Document reactionCounts(String reactions) {
+    Document list = ifNull(reactions, List.of());
+    Document emojis = new Document("$setUnion", List.of(
+        new Document("$map", new Document("input", list).append("as", "r").append("in", "$$r.emoji")),
+        List.of()));
+    Document count = new Document("$toLong", new Document("$size", new Document("$filter",
+        new Document("input", list).append("as", "r")
+            .append("cond", new Document("$eq", List.of("$$r.emoji", "$$e"))))));
+    return new Document("$arrayToObject", new Document("$map", new Document("input", emojis)
+        .append("as", "e")
+        .append("in", new Document("k", "$$e").append("v", count))));
+  }
+
+  private static Document ifNull(Object value, Object fallback) {
+    return new Document("$ifNull", List.of(value, fallback));
+  }
+}
@@ -1,9 +1,14 @@
 package com.danielblanco.arquitecturasmodernas.cqrs.mongo.model;
 
+import org.springframework.data.mongodb.core.mapping.Document;
+
+// Las reacciones viven en su propia colección para que el documento del post no crezca
+@Document("reactions")
 public class Reaction {
 
   private String id;
   private String emoji;
+  private String commentId;
 
   public String getId() {
     return id;
@@ -20,4 +25,12 @@ public class Reaction {
   public void setEmoji(String emoji) {
     this.emoji = emoji;
   }
+
+  public String getCommentId() {
+    return commentId;
+  }
+
+  public void setCommentId(String commentId) {
+    this.commentId = commentId;
+  }
 }
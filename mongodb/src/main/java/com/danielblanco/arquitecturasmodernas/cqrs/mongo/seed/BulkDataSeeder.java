@@ -4,7 +4,9 @@ import com.danielblanco.arquitecturasmodernas.cqrs.mongo.model.Comment;
 import com.danielblanco.arquitecturasmodernas.cqrs.mongo.model.Post;
 import com.danielblanco.arquitecturasmodernas.cqrs.mongo.model.Reaction;
 import java.util.ArrayList;
+import java.util.HashMap;
 import java.util.List;
+import java.util.Map;
 import java.util.UUID;
 import java.util.concurrent.ThreadLocalRandom;
 import org.slf4j.Logger;
@@ -62,6 +64,7 @@ public class BulkDataSeeder implements ApplicationRunner {
     }
 
     List<Post> buffer = new ArrayList<>(batchSize);
+    List<Reaction> reactionBuffer = new ArrayList<>();
     ThreadLocalRandom rnd = ThreadLocalRandom.current();
 
     log.info("Starting seed of {} posts...", posts);
@@ -83,14 +86,16 @@ public class BulkDataSeeder implements ApplicationRunner {
 
           int reactionsCount = randomBetween(rnd, minReactionsPerComment, maxReactionsPerComment);
           if (reactionsCount > 0) {
-            List<Reaction> reactions = new ArrayList<>(reactionsCount);
+            Map<String, Long> reactionCounts = new HashMap<>();
             for (int r = 0; r < reactionsCount; r++) {
               Reaction reaction = new Reaction();
               reaction.setId(UUID.randomUUID().toString());
               reaction.setEmoji(EMOJIS[rnd.nextInt(EMOJIS.length)]);
-              reactions.add(reaction);
+              reaction.setCommentId(comment.getId());
+              reactionBuffer.add(reaction);
+              reactionCounts.merge(reaction.getEmoji(), 1L, Long::sum);
             }
-            comment.setReactions(reactions);
+            comment.setReactionCounts(reactionCounts);
           }
           comments.add(comment);
         }
@@ -103,6 +108,8 @@ public class BulkDataSeeder implements ApplicationRunner {
       if (buffer.size() >= batchSize) {
         mongoTemplate.insert(buffer, Post.class);
         buffer.clear();
+        mongoTemplate.insert(reactionBuffer, Reaction.class);
+        reactionBuffer.clear();
         log.info("Inserted {} posts so far...", i);
       }
 
@@ -117,6 +124,10 @@ public class BulkDataSeeder implements ApplicationRunner {
       mongoTemplate.insert(buffer, Post.class);
       buffer.clear();
     }
+    if (!reactionBuffer.isEmpty()) {
+      mongoTemplate.insert(reactionBuffer, Reaction.class);
+      reactionBuffer.clear();
+    }
 
     long endTime = System.currentTimeMillis();
     log.info("Seed completed: {} posts in {} ms", posts, (endTime - startTime));
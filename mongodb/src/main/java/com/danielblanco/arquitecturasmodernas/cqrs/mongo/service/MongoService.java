@@ -4,7 +4,12 @@ import com.danielblanco.arquitecturasmodernas.cqrs.mongo.model.Comment;
 import com.danielblanco.arquitecturasmodernas.cqrs.mongo.model.Post;
 import com.danielblanco.arquitecturasmodernas.cqrs.mongo.model.Reaction;
 import com.danielblanco.arquitecturasmodernas.cqrs.mongo.repository.PostRepository;
+import com.mongodb.client.result.UpdateResult;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Map;
 import java.util.UUID;
+import java.util.stream.Collectors;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.data.mongodb.core.FindAndModifyOptions;
 import org.springframework.data.mongodb.core.MongoOperations;
@@ -24,12 +29,35 @@ public class MongoService {
   @Autowired
   private MongoOperations mongoOps;
 
-  public Post getPost(String id) {
-    return postRepository.findById(id).orElseThrow(() -> new ResponseStatusException(HttpStatus.NOT_FOUND));
+  public Post getPost(String id, boolean includeReactions) {
+    Post post = mongoOps.findOne(new Query(Criteria.where("id").is(id)), Post.class);
+    if (post == null) {
+      throw new ResponseStatusException(HttpStatus.NOT_FOUND);
+    }
+    if (includeReactions) {
+      attachReactions(post);
+    }
+    return post;
+  }
+
+  private void attachReactions(Post post) {
+    if (post.getComments() == null || post.getComments().isEmpty()) {
+      return;
+    }
+    List<String> commentIds = post.getComments().stream().map(Comment::getId).collect(Collectors.toList());
+    Map<String, List<Reaction>> reactionsByComment = mongoOps
+        .find(new Query(Criteria.where("commentId").in(commentIds)), Reaction.class)
+        .stream().collect(Collectors.groupingBy(Reaction::getCommentId));
+    for (Comment comment : post.getComments()) {
+      comment.setReactions(reactionsByComment.getOrDefault(comment.getId(), new ArrayList<>()));
+    }
   }
 
   public Comment addComment(String postId, Comment comment) {
     comment.setId(UUID.randomUUID().toString());
+    // Las reacciones y sus contadores solo se modifican con addReaction
+    comment.setReactions(null);
+    comment.setReactionCounts(null);
     Update update = new Update();
     Query query = new Query();
     query.addCriteria((Criteria.where("id").is((postId))));
@@ -43,13 +71,24 @@ public class MongoService {
   }
 
   public Reaction addReaction(String postId, String commentId, Reaction reaction) {
+    String emoji = reaction.getEmoji();
+    // El emoji se usa como nombre de campo del contador
+    if (emoji == null || emoji.isEmpty() || emoji.contains(".") || emoji.startsWith("$")) {
+      throw new ResponseStatusException(HttpStatus.BAD_REQUEST);
+    }
+    // Primero se guarda la reacción: si falla, el contador no llega a incrementarse
     reaction.setId(UUID.randomUUID().toString());
+    reaction.setCommentId(commentId);
+    Reaction saved = mongoOps.insert(reaction);
     Query query = new Query(new Criteria().andOperator(
         Criteria.where("id").is(postId),
         Criteria.where("comments").elemMatch(Criteria.where("id").is(commentId))
     ));
-    Update update = new Update().addToSet("comments.$.reactions", reaction);
-    mongoOps.findAndModify(query, update, FindAndModifyOptions.options().upsert(false), Post.class);
-    return reaction;
+    UpdateResult result = mongoOps.updateFirst(query, new Update().inc("comments.$.reactionCounts." + emoji, 1L), Post.class);
+    if (result.getMatchedCount() == 0) {
+      mongoOps.remove(saved);
+      throw new ResponseStatusException(HttpStatus.NOT_FOUND);
+    }
+    return saved;
   }
 }
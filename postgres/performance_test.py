@@ -2,8 +2,11 @@
 """
 Script de pruebas de rendimiento para aplicación CQRS
 Realiza 50 inserciones y 50 consultas, midiendo tiempos y generando estadísticas
+La carga es determinista (semilla fija) y se graba en una traza reproducible con workload_trace.py
 """
 
+import os
+import sys
 import requests
 import time
 import csv
@@ -13,30 +16,41 @@ from datetime import datetime
 import random
 import string
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from workload_trace import TraceRecorder
+
 # Configuración
 BASE_URL = "http://localhost:5100"
 NUM_OPERATIONS = 50
+RANDOM_SEED = 42
 
 class PerformanceTest:
-    def __init__(self):
+    def __init__(self, recorder):
         self.results = []
         self.post_id = None   # Post único donde meteremos comentarios
         self.comment_ids = [] # Guardar los IDs de comentarios
+        self.rng = random.Random(RANDOM_SEED)
+        self.recorder = recorder
 
     def generate_random_content(self, length=50):
         """Genera contenido aleatorio para los comentarios"""
-        return ''.join(random.choices(string.ascii_letters + string.digits + ' ', k=length))
+        return ''.join(self.rng.choices(string.ascii_letters + string.digits + ' ', k=length))
     
     def create_base_post(self):
         """Crea un post inicial para poder insertar comentarios"""
         post_data = {"content": "Post inicial para pruebas de comentarios"}
         try:
+            start_time = time.perf_counter()
             response = requests.post(f"{BASE_URL}/post",
                                      json=post_data,
                                      headers={"Content-Type": "application/json"},
                                      timeout=10)
             if response.status_code == 200:
                 self.post_id = response.json().get("id")
+            self.recorder.record('INSERT_POST', 'POST', "/post", body=post_data,
+                                 status_code=response.status_code, resolved_id=self.post_id,
+                                 issued_at=start_time)
+            if self.post_id:
                 print(f"✓ Post base creado con ID {self.post_id}")
             else:
                 raise RuntimeError(f"Error creando post base: {response.status_code}")
@@ -59,17 +73,24 @@ class PerformanceTest:
             end_time = time.perf_counter()
             duration_ms = (end_time - start_time) * 1000
             
+            comment_id = None
             if response.status_code == 200:
                 comment_id = response.json().get("id")
                 if comment_id:
                     self.comment_ids.append(comment_id)
-                return duration_ms, True, response.status_code
-            return duration_ms, False, response.status_code
+            self.recorder.record('INSERT_COMMENT', 'POST', "/post/{postId}/comment",
+                                 ids={"postId": self.post_id}, body=comment_data,
+                                 status_code=response.status_code, resolved_id=comment_id,
+                                 issued_at=start_time)
+            return duration_ms, response.status_code == 200, response.status_code
         
         except requests.exceptions.RequestException as e:
             end_time = time.perf_counter()
             duration_ms = (end_time - start_time) * 1000
             print(f"Error en inserción de comentario: {e}")
+            self.recorder.record('INSERT_COMMENT', 'POST', "/post/{postId}/comment",
+                                 ids={"postId": self.post_id}, body=comment_data,
+                                 status_code=-1, issued_at=start_time)
             return duration_ms, False, -1
     
     def test_post_query(self):
@@ -84,11 +105,15 @@ class PerformanceTest:
             
             duration_ms = (end_time - start_time) * 1000
             success = response.status_code == 200
+            self.recorder.record('QUERY_POST', 'GET', "/post/{postId}", ids={"postId": self.post_id},
+                                 status_code=response.status_code, issued_at=start_time)
             return duration_ms, success, response.status_code
         except requests.exceptions.RequestException as e:
             end_time = time.perf_counter()
             duration_ms = (end_time - start_time) * 1000
             print(f"Error en consulta del post base: {e}")
+            self.recorder.record('QUERY_POST', 'GET', "/post/{postId}", ids={"postId": self.post_id},
+                                 status_code=-1, issued_at=start_time)
             return duration_ms, False, -1
     
     def run_insertion_tests(self):
@@ -270,11 +295,13 @@ def main():
         print("⚠️  No se puede conectar al servidor en", BASE_URL)
         return
     
-    test = PerformanceTest()
-    test.create_base_post()
-    
+    trace_file = f"workload_trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz"
+    recorder = TraceRecorder(trace_file, "postgres/performance_test.py", BASE_URL, RANDOM_SEED)
+    test = PerformanceTest(recorder)
 
     try:
+        test.create_base_post()
+
         test.run_insertion_tests()
         test.run_query_tests()
 
@@ -289,10 +316,13 @@ def main():
         print(f"📄 Archivos generados:")
         print(f"   - {csv_file}")
         print(f"   - {stats_file}")
+        print(f"   - {trace_file}")
         
     except KeyboardInterrupt:
         print("\n⏹️  Pruebas interrumpidas por el usuario")
     except Exception as e:
         print(f"\n❌ Error durante las pruebas: {e}")
+    finally:
+        recorder.close()
 if __name__ == "__main__":
     main()
\ No newline at end of file
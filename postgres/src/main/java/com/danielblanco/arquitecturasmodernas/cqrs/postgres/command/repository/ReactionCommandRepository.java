@@ -1,10 +1,18 @@
 package com.danielblanco.arquitecturasmodernas.cqrs.postgres.command.repository;
 
 import com.danielblanco.arquitecturasmodernas.cqrs.postgres.command.model.ReactionCommand;
+import org.springframework.data.jpa.repository.Modifying;
+import org.springframework.data.jpa.repository.Query;
 import org.springframework.data.repository.CrudRepository;
+import org.springframework.data.repository.query.Param;
 import org.springframework.stereotype.Repository;
 
 @Repository
 public interface ReactionCommandRepository extends CrudRepository<ReactionCommand, Long> {
 
+  @Modifying
+  @Query(value = "insert into cqrs.comment_reaction_count (comment_id, emoji, count) values (:commentId, :emoji, 1) "
+      + "on conflict (comment_id, emoji) do update set count = cqrs.comment_reaction_count.count + 1",
+      nativeQuery = true)
+  void incrementCount(@Param("commentId") Long commentId, @Param("emoji") String emoji);
 }
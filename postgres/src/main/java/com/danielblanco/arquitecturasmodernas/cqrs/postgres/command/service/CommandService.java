@@ -8,6 +8,7 @@ import com.danielblanco.arquitecturasmodernas.cqrs.postgres.command.repository.P
 import com.danielblanco.arquitecturasmodernas.cqrs.postgres.command.repository.ReactionCommandRepository;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
 
 @Service
 public class CommandService {
@@ -30,8 +31,11 @@ public class CommandService {
     return commentRepository.save(comment);
   }
 
+  @Transactional
   public ReactionCommand addReaction(Long postId, Long commentId, ReactionCommand reaction) {
     reaction.setCommentId(commentId);
-    return reactionRepository.save(reaction);
+    ReactionCommand saved = reactionRepository.save(reaction);
+    reactionRepository.incrementCount(commentId, reaction.getEmoji());
+    return saved;
   }
 }
@@ -5,6 +5,7 @@ import com.danielblanco.arquitecturasmodernas.cqrs.postgres.query.service.QueryS
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.web.bind.annotation.GetMapping;
 import org.springframework.web.bind.annotation.PathVariable;
+import org.springframework.web.bind.annotation.RequestParam;
 import org.springframework.web.bind.annotation.RestController;
 
 @RestController
@@ -14,7 +15,8 @@ public class QueryController {
   private QueryService queryService;
 
   @GetMapping("/post/{id}")
-  public PostQuery getPost(@PathVariable Long id) {
-    return queryService.getPost(id);
+  public PostQuery getPost(@PathVariable Long id,
+      @RequestParam(defaultValue = "false") boolean includeReactions) {
+    return queryService.getPost(id, includeReactions);
   }
 }
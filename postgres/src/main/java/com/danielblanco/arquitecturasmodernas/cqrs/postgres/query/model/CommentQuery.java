@@ -1,13 +1,20 @@
 package com.danielblanco.arquitecturasmodernas.cqrs.postgres.query.model;
 
+import com.fasterxml.jackson.annotation.JsonInclude;
 import java.util.List;
-import javax.persistence.CascadeType;
+import java.util.Map;
+import javax.persistence.CollectionTable;
 import javax.persistence.Column;
+import javax.persistence.ElementCollection;
 import javax.persistence.Entity;
 import javax.persistence.FetchType;
 import javax.persistence.Id;
-import javax.persistence.OneToMany;
+import javax.persistence.JoinColumn;
+import javax.persistence.MapKeyColumn;
 import javax.persistence.Table;
+import javax.persistence.Transient;
+import org.hibernate.annotations.Fetch;
+import org.hibernate.annotations.FetchMode;
 
 @Entity
 @Table(name = "comment", schema = "cqrs")
@@ -18,8 +25,16 @@ public class CommentQuery {
   private String content;
   @Column(name = "post_id")
   private Long postId;
-  @OneToMany(mappedBy = "commentId", cascade = CascadeType.ALL, fetch = FetchType.EAGER)
+  // Las reacciones completas solo se cargan bajo demanda (ver QueryService)
+  @Transient
+  @JsonInclude(JsonInclude.Include.NON_NULL)
   private List<ReactionQuery> reactions;
+  @ElementCollection(fetch = FetchType.EAGER)
+  @Fetch(FetchMode.SUBSELECT)
+  @CollectionTable(name = "comment_reaction_count", schema = "cqrs", joinColumns = @JoinColumn(name = "comment_id"))
+  @MapKeyColumn(name = "emoji")
+  @Column(name = "count")
+  private Map<String, Long> reactionCounts;
 
   public Long getId() {
     return id;
@@ -52,4 +67,12 @@ public class CommentQuery {
   public void setReactions(List<ReactionQuery> reactions) {
     this.reactions = reactions;
   }
+
+  public Map<String, Long> getReactionCounts() {
+    return reactionCounts;
+  }
+
+  public void setReactionCounts(Map<String, Long> reactionCounts) {
+    this.reactionCounts = reactionCounts;
+  }
 }
@@ -0,0 +1,13 @@
+package com.danielblanco.arquitecturasmodernas.cqrs.postgres.query.repository;
+
+import com.danielblanco.arquitecturasmodernas.cqrs.postgres.query.model.ReactionQuery;
+import java.util.Collection;
+import java.util.List;
+import org.springframework.data.repository.CrudRepository;
+import org.springframework.stereotype.Repository;
+
+@Repository
+public interface ReactionQueryRepository extends CrudRepository<ReactionQuery, Long> {
+
+  List<ReactionQuery> findAllByCommentIdIn(Collection<Long> commentIds);
+}
@@ -1,7 +1,14 @@
 package com.danielblanco.arquitecturasmodernas.cqrs.postgres.query.service;
 
+import com.danielblanco.arquitecturasmodernas.cqrs.postgres.query.model.CommentQuery;
 import com.danielblanco.arquitecturasmodernas.cqrs.postgres.query.model.PostQuery;
+import com.danielblanco.arquitecturasmodernas.cqrs.postgres.query.model.ReactionQuery;
 import com.danielblanco.arquitecturasmodernas.cqrs.postgres.query.repository.PostQueryRepository;
+import com.danielblanco.arquitecturasmodernas.cqrs.postgres.query.repository.ReactionQueryRepository;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Map;
+import java.util.stream.Collectors;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.http.HttpStatus;
 import org.springframework.stereotype.Service;
@@ -13,8 +20,20 @@ public class QueryService {
   @Autowired
   private PostQueryRepository postRepository;
 
-  public PostQuery getPost(Long id) {
-    return postRepository.findById(id).orElseThrow(() -> new ResponseStatusException(
+  @Autowired
+  private ReactionQueryRepository reactionRepository;
+
+  public PostQuery getPost(Long id, boolean includeReactions) {
+    PostQuery post = postRepository.findById(id).orElseThrow(() -> new ResponseStatusException(
         HttpStatus.NOT_FOUND));
+    if (includeReactions && post.getComments() != null && !post.getComments().isEmpty()) {
+      List<Long> commentIds = post.getComments().stream().map(CommentQuery::getId).collect(Collectors.toList());
+      Map<Long, List<ReactionQuery>> reactionsByComment = reactionRepository.findAllByCommentIdIn(commentIds)
+          .stream().collect(Collectors.groupingBy(ReactionQuery::getCommentId));
+      for (CommentQuery comment : post.getComments()) {
+        comment.setReactions(reactionsByComment.getOrDefault(comment.getId(), new ArrayList<>()));
+      }
+    }
+    return post;
   }
 }
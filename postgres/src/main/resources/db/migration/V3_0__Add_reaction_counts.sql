@@ -0,0 +1,17 @@
+-- Contadores de reacciones por comentario y emoji para el modelo de lectura
+create table if not exists cqrs.comment_reaction_count (
+    comment_id bigint not null,
+    emoji varchar not null,
+    count bigint not null default 0,
+    primary key (comment_id, emoji),
+    foreign key (comment_id) references cqrs.comment (id)
+);
+
+-- Carga inicial a partir de las reacciones existentes
+INSERT INTO cqrs.comment_reaction_count (comment_id, emoji, count)
+SELECT comment_id, emoji, COUNT(*)
+FROM cqrs.comment_reaction
+GROUP BY comment_id, emoji;
+
+-- Índice para cargar las reacciones de un comentario bajo demanda
+create index if not exists comment_reaction_comment_id_idx on cqrs.comment_reaction (comment_id);
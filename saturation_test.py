@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Búsqueda automática del punto de saturación (capacidad máxima sostenible)
+Para cada backend y tipo de operación aumenta la carga ofrecida (peticiones por
+segundo) por escalones o por bisección. Cada escalón tiene una ventana de
+calentamiento que se descarta y una ventana estable que se mide.
+La búsqueda se detiene cuando se incumple el SLO de latencia (p99) o de errores,
+y se informa del "codo": el máximo throughput que todavía cumple el SLO.
+
+Ejemplos:
+  python3 saturation_test.py --backend postgres
+  python3 saturation_test.py --backend mongodb --mode bisect --slo-p99-ms 150
+  python3 saturation_test.py --backend advanced-cqrs --operations QUERY_POST
+
+Los datos aleatorios salen de un generador con semilla (--seed) y todas las
+peticiones emitidas se graban en una traza reproducible con workload_trace.py.
+"""
+
+import argparse
+import csv
+import random
+import statistics
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from workload_trace import TraceRecorder
+
+# Configuración de los backends (puertos de docker-compose / scripts de cada proyecto)
+BACKENDS = {
+    "postgres": {"base_url": "http://localhost:5100", "sync": False},
+    "advanced-cqrs": {"base_url": "http://localhost:8085", "sync": True},
+    "mongodb": {"base_url": "http://localhost:8085", "sync": False},
+}
+
+OPERATIONS = ["INSERT_POST", "INSERT_COMMENT", "INSERT_REACTION", "QUERY_POST"]
+EMOJIS = ["👍", "❤️", "😂", "🎉", "🚀", "😮", "😢", "👎"]
+
+# Valores por defecto de la búsqueda
+DEFAULT_SLO_P99_MS = 200.0
+DEFAULT_SLO_ERROR_RATE = 0.01
+DEFAULT_START_RPS = 10.0
+DEFAULT_STEP_RPS = 10.0
+DEFAULT_MAX_RPS = 2000.0
+DEFAULT_WARMUP_S = 5.0
+DEFAULT_DURATION_S = 20.0
+DEFAULT_CONCURRENCY = 64
+DEFAULT_SEED_POSTS = 20
+RANDOM_SEED = 42
+# Si el throughput conseguido es menor que esta fracción del ofrecido, el backend no da abasto
+MIN_THROUGHPUT_RATIO = 0.9
+# La bisección termina cuando el intervalo es menor que esta fracción del límite inferior
+BISECT_TOLERANCE = 0.05
+# Nota del codo cuando la búsqueda llega a --max-rps sin incumplir el SLO (solo es una cota inferior)
+NO_BREACH_NOTE = "no se incumplió el SLO hasta --max-rps"
+
+
+def percentile(times, p):
+    """Percentil p (1-99); el método inclusivo no extrapola por encima de la muestra máxima"""
+    if not times:
+        return 0.0
+    if len(times) == 1:
+        return times[0]
+    return statistics.quantiles(times, n=100, method="inclusive")[p - 1]
+
+
+class SaturationTest:
+    def __init__(self, backend, base_url, slo_p99_ms, slo_error_rate,
+                 warmup_s, duration_s, concurrency, seed_posts, seed, recorder=None):
+        self.backend = backend
+        self.base_url = base_url
+        self.sync = BACKENDS[backend]["sync"]
+        self.slo_p99_ms = slo_p99_ms
+        self.slo_error_rate = slo_error_rate
+        self.warmup_s = warmup_s
+        self.duration_s = duration_s
+        self.concurrency = concurrency
+        self.seed_posts = seed_posts
+        self.steps = []           # Resultados de cada escalón
+        self.post_ids = []        # Posts del escalón actual para comentarios y consultas
+        self.comment_refs = []    # Lista de (postId, commentId) del escalón actual para reacciones
+        # El generador solo se usa desde el hilo que programa las peticiones,
+        # así la secuencia no depende del reparto entre hilos
+        self.rng = random.Random(seed)
+        self.recorder = recorder
+        self._local = threading.local()
+
+    def session(self):
+        """Una sesión HTTP por hilo, con pool de conexiones del tamaño de la concurrencia"""
+        if not hasattr(self._local, "session"):
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+            session.mount("http://", adapter)
+            self._local.session = session
+        return self._local.session
+
+    def generate_random_content(self, length=50):
+        return ''.join(self.rng.choices(string.ascii_letters + string.digits + ' ', k=length))
+
+    def seed_data(self):
+        """
+        Crea posts nuevos, con un comentario cada uno, sobre los que trabaja un escalón.
+        Cada escalón usa los suyos para que todos partan del mismo tamaño de datos y el
+        resultado no dependa de los comentarios y reacciones añadidos por los anteriores.
+        """
+        post_ids, comment_refs = [], []
+        for _ in range(self.seed_posts):
+            status_code, post_id = self.execute_operation('INSERT_POST', self.build_request('INSERT_POST'))
+            if status_code != 200 or post_id is None:
+                raise RuntimeError(f"Error creando post base: {status_code}")
+            comment_request = ('POST', "/post/{postId}/comment", {"postId": post_id},
+                               {"content": self.generate_random_content(20)})
+            status_code, comment_id = self.execute_operation('INSERT_COMMENT', comment_request)
+            if status_code != 200 or comment_id is None:
+                raise RuntimeError(f"Error creando comentario base: {status_code}")
+            post_ids.append(post_id)
+            comment_refs.append((post_id, comment_id))
+
+        if self.sync:
+            # advanced-cqrs: el modelo de lectura (MongoDB) se actualiza con /sync
+            status_code, _ = self.execute_operation('SYNC', ('POST', "/sync", {}, None), timeout=60)
+            if status_code != 200:
+                raise RuntimeError(f"Error sincronizando el modelo de lectura: {status_code}")
+        self.post_ids, self.comment_refs = post_ids, comment_refs
+
+    def build_request(self, operation):
+        """Elige endpoint, ids y cuerpo de una operación: (método, ruta, ids, cuerpo)"""
+        if operation == "INSERT_POST":
+            return 'POST', "/post", {}, {"content": self.generate_random_content()}
+        elif operation == "INSERT_COMMENT":
+            post_id = self.rng.choice(self.post_ids)
+            return 'POST', "/post/{postId}/comment", {"postId": post_id}, {"content": self.generate_random_content(20)}
+        elif operation == "INSERT_REACTION":
+            post_id, comment_id = self.rng.choice(self.comment_refs)
+            return ('POST', "/post/{postId}/comment/{commentId}/reaction",
+                    {"postId": post_id, "commentId": comment_id}, {"emoji": self.rng.choice(EMOJIS)})
+        elif operation == "QUERY_POST":
+            post_id = self.rng.choice(self.post_ids)
+            return 'GET', "/post/{postId}", {"postId": post_id}, None
+        raise ValueError(f"Operación desconocida: {operation}")
+
+    def execute_operation(self, operation, request, issued_at=None, timeout=10):
+        """
+        Lanza la petición, la graba en la traza y devuelve (código HTTP, id creado).
+        El código es -1 si falla la conexión.
+        """
+        method, path, ids, body = request
+        status_code, resolved_id = -1, None
+        issued_at = time.perf_counter() if issued_at is None else issued_at
+        try:
+            response = self.session().request(method, f"{self.base_url}{path.format(**ids)}",
+                                              json=body, timeout=timeout)
+            status_code = response.status_code
+            if method == 'POST' and response.ok and response.content:
+                resolved_id = response.json().get("id")
+        except (requests.exceptions.RequestException, ValueError):
+            pass
+        if self.recorder:
+            self.recorder.record(operation, method, path, ids=ids, body=body, status_code=status_code,
+                                 resolved_id=resolved_id, issued_at=issued_at)
+        return status_code, resolved_id
+
+    def run_step(self, operation, rps):
+        """
+        Ofrece carga constante (bucle abierto) durante calentamiento + ventana estable.
+        La latencia se mide desde el instante programado de cada petición, de modo que
+        el tiempo en cola cuenta cuando el backend no da abasto.
+        """
+        self.seed_data()
+        samples = []
+        lock = threading.Lock()
+        interval = 1.0 / rps
+        total_s = self.warmup_s + self.duration_s
+        start = time.perf_counter()
+        steady_start = start + self.warmup_s
+
+        def task(scheduled, request):
+            try:
+                status_code, _ = self.execute_operation(operation, request, issued_at=scheduled)
+            except Exception:
+                # Cualquier fallo cuenta como error; si no, el future lo ocultaría
+                status_code = -1
+            end = time.perf_counter()
+            with lock:
+                samples.append((scheduled, end, status_code))
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            i = 0
+            while True:
+                scheduled = start + i * interval
+                if scheduled - start >= total_s:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(task, scheduled, self.build_request(operation))
+                i += 1
+
+        # Solo cuentan las peticiones programadas dentro de la ventana estable
+        steady = [s for s in samples if s[0] >= steady_start]
+        latencies = [(end - scheduled) * 1000 for scheduled, end, code in steady if code in (200, 201)]
+        errors = len(steady) - len(latencies)
+        error_rate = errors / len(steady) if steady else 1.0
+        # Throughput conseguido: respuestas correctas completadas dentro de la ventana estable
+        steady_end = steady_start + self.duration_s
+        completed = [s for s in samples if steady_start <= s[1] < steady_end and s[2] in (200, 201)]
+        achieved_rps = len(completed) / self.duration_s
+
+        p99 = percentile(latencies, 99)
+        breach_reasons = []
+        if p99 > self.slo_p99_ms:
+            breach_reasons.append(f"p99 {p99:.1f}ms > {self.slo_p99_ms:.1f}ms")
+        if error_rate > self.slo_error_rate:
+            breach_reasons.append(f"errores {error_rate*100:.2f}% > {self.slo_error_rate*100:.2f}%")
+        if achieved_rps < rps * MIN_THROUGHPUT_RATIO:
+            breach_reasons.append(f"throughput {achieved_rps:.1f} < {rps*MIN_THROUGHPUT_RATIO:.1f} rps")
+
+        result = {
+            'backend': self.backend,
+            'operation_type': operation,
+            'offered_rps': rps,
+            'achieved_rps': achieved_rps,
+            'requests': len(steady),
+            'errors': errors,
+            'error_rate': error_rate,
+            'avg_ms': statistics.mean(latencies) if latencies else 0.0,
+            'p50_ms': percentile(latencies, 50),
+            'p95_ms': percentile(latencies, 95),
+            'p99_ms': p99,
+            'max_ms': max(latencies) if latencies else 0.0,
+            'slo_ok': not breach_reasons,
+            'breach_reason': "; ".join(breach_reasons),
+            'knee_note': "",
+            'timestamp': datetime.now().isoformat()
+        }
+        self.steps.append(result)
+        print(f"  {operation} @ {rps:.1f} rps: conseguido {achieved_rps:.1f} rps, "
+              f"p99 {p99:.2f}ms, errores {error_rate*100:.2f}% - "
+              f"{'✓' if result['slo_ok'] else '✗ ' + result['breach_reason']}")
+        return result
+
+    def mark_knee(self, knee, breached):
+        """Anota el escalón del codo; si el SLO nunca se incumplió el codo es solo una cota inferior"""
+        if knee is None:
+            return None
+        knee['knee_note'] = "codo" if breached else NO_BREACH_NOTE
+        if not breached:
+            print(f"  ⚠️  {NO_BREACH_NOTE}: {knee['achieved_rps']:.1f} rps es solo una cota inferior")
+        return knee
+
+    def search_step(self, operation, start_rps, step_rps, max_rps):
+        """Incrementa la carga de forma lineal hasta incumplir el SLO; el último escalón es --max-rps"""
+        knee = None
+        rps = start_rps
+        while rps <= max_rps:
+            result = self.run_step(operation, rps)
+            if not result['slo_ok']:
+                return self.mark_knee(knee, True)
+            knee = result
+            if rps >= max_rps:
+                break
+            rps = min(rps + step_rps, max_rps)
+        return self.mark_knee(knee, False)
+
+    def search_bisect(self, operation, start_rps, max_rps):
+        """Duplica la carga hasta incumplir el SLO y después biseca entre el último escalón bueno y el malo"""
+        knee = None
+        low, high = 0.0, None
+        rps = start_rps
+        while rps <= max_rps:
+            result = self.run_step(operation, rps)
+            if not result['slo_ok']:
+                high = rps
+                break
+            knee, low = result, rps
+            if rps >= max_rps:
+                break
+            # Si al duplicar se pasa de --max-rps, el último escalón es --max-rps
+            rps = min(rps * 2, max_rps)
+        if high is None:
+            return self.mark_knee(knee, False)
+
+        while high - low > max(low * BISECT_TOLERANCE, 1.0):
+            mid = (low + high) / 2
+            result = self.run_step(operation, mid)
+            if result['slo_ok']:
+                knee, low = result, mid
+            else:
+                high = mid
+        return self.mark_knee(knee, True)
+
+    def save_csv_results(self):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"saturation_results_{self.backend}_{timestamp}.csv"
+        fieldnames = ['backend', 'operation_type', 'offered_rps', 'achieved_rps', 'requests',
+                      'errors', 'error_rate', 'avg_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms',
+                      'slo_ok', 'breach_reason', 'knee_note', 'timestamp']
+        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer.writeheader()
+            for step in self.steps:
+                writer.writerow(step)
+        return filename
+
+    def save_knee_report(self, knees):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"saturation_statistics_{self.backend}_{timestamp}.txt"
+
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write("=" * 60 + "\n")
+            f.write("PUNTO DE SATURACIÓN - APLICACIÓN CQRS\n")
+            f.write("=" * 60 + "\n")
+            f.write(f"Fecha y hora: {datetime.now()}\n")
+            f.write(f"Backend: {self.backend}\n")
+            f.write(f"URL base: {self.base_url}\n")
+            f.write(f"SLO: p99 <= {self.slo_p99_ms:.1f} ms, errores <= {self.slo_error_rate*100:.2f}%\n")
+            f.write(f"Calentamiento / ventana estable: {self.warmup_s:g} s / {self.duration_s:g} s\n")
+            f.write(f"Concurrencia máxima del cliente: {self.concurrency}\n\n")
+
+            for operation, knee in knees.items():
+                f.write(f"{operation}:\n")
+                f.write("-" * (len(operation) + 1) + "\n")
+                if knee is None:
+                    f.write("El SLO se incumple ya con la carga inicial\n\n")
+                    continue
+                # Ley de Little: peticiones en vuelo = throughput * latencia media
+                in_flight = knee['achieved_rps'] * knee['avg_ms'] / 1000
+                if knee['knee_note'] == NO_BREACH_NOTE:
+                    f.write(f"Cota inferior ({NO_BREACH_NOTE}): {knee['achieved_rps']:.2f} rps "
+                            f"(ofrecido {knee['offered_rps']:.2f} rps)\n")
+                else:
+                    f.write(f"Throughput máximo con SLO: {knee['achieved_rps']:.2f} rps "
+                            f"(ofrecido {knee['offered_rps']:.2f} rps)\n")
+                f.write(f"Latencia media: {knee['avg_ms']:.2f} ms\n")
+                f.write(f"Percentil 50: {knee['p50_ms']:.2f} ms\n")
+                f.write(f"Percentil 95: {knee['p95_ms']:.2f} ms\n")
+                f.write(f"Percentil 99: {knee['p99_ms']:.2f} ms\n")
+                f.write(f"Tasa de errores: {knee['error_rate']*100:.2f}%\n")
+                f.write(f"Peticiones en vuelo estimadas (Ley de Little): {in_flight:.1f}\n\n")
+
+        return filename
+
+
+def positive_float(value):
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError("Debe ser un número positivo")
+    return number
+
+
+def non_negative_float(value):
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("Debe ser un número mayor o igual que 0")
+    return number
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("Debe ser un entero mayor o igual que 1")
+    return number
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Búsqueda del throughput máximo sostenible con SLO")
+    parser.add_argument("--backend", choices=BACKENDS.keys(), required=True)
+    parser.add_argument("--url", help="URL base (por defecto la del backend)")
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=OPERATIONS)
+    parser.add_argument("--mode", choices=["step", "bisect"], default="step")
+    parser.add_argument("--start-rps", type=positive_float, default=DEFAULT_START_RPS)
+    parser.add_argument("--step-rps", type=positive_float, default=DEFAULT_STEP_RPS)
+    parser.add_argument("--max-rps", type=positive_float, default=DEFAULT_MAX_RPS)
+    parser.add_argument("--warmup", type=non_negative_float, default=DEFAULT_WARMUP_S, help="Segundos de calentamiento por escalón")
+    parser.add_argument("--duration", type=positive_float, default=DEFAULT_DURATION_S, help="Segundos medidos por escalón")
+    parser.add_argument("--slo-p99-ms", type=positive_float, default=DEFAULT_SLO_P99_MS)
+    parser.add_argument("--slo-error-rate", type=non_negative_float, default=DEFAULT_SLO_ERROR_RATE)
+    parser.add_argument("--concurrency", type=positive_int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--seed-posts", type=positive_int, default=DEFAULT_SEED_POSTS,
+                        help="Posts base que se crean antes de cada escalón")
+    parser.add_argument("--seed", type=int, default=RANDOM_SEED, help="Semilla de los datos aleatorios")
+    parser.add_argument("--no-trace", action="store_true", help="No grabar la traza de carga")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    base_url = args.url or BACKENDS[args.backend]["base_url"]
+
+    print("🚀 Búsqueda del punto de saturación CQRS")
+    print(f"Backend: {args.backend} ({base_url})")
+    print(f"Modo: {args.mode} | SLO p99 <= {args.slo_p99_ms} ms, errores <= {args.slo_error_rate*100:.2f}%\n")
+
+    recorder = None
+    if not args.no_trace:
+        trace_file = f"workload_trace_{args.backend}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz"
+        recorder = TraceRecorder(trace_file, "saturation_test.py", base_url, args.seed)
+    test = SaturationTest(args.backend, base_url, args.slo_p99_ms, args.slo_error_rate,
+                          args.warmup, args.duration, args.concurrency, args.seed_posts, args.seed, recorder)
+    knees = {}
+    print(f"Cada escalón crea {args.seed_posts} posts base con un comentario cada uno")
+    try:
+        for operation in args.operations:
+            print(f"\nBuscando saturación de {operation}...")
+            if args.mode == "bisect":
+                knees[operation] = test.search_bisect(operation, args.start_rps, args.max_rps)
+            else:
+                knees[operation] = test.search_step(operation, args.start_rps, args.step_rps, args.max_rps)
+    except KeyboardInterrupt:
+        print("\n⏹️  Búsqueda interrumpida por el usuario")
+    except Exception as e:
+        print(f"\n❌ Error durante la búsqueda: {e}")
+    finally:
+        if recorder:
+            recorder.close()
+
+    if test.steps:
+        csv_file = test.save_csv_results()
+        stats_file = test.save_knee_report(knees)
+        print(f"\n✅ Búsqueda completada\nArchivos generados:\n  - {csv_file}\n  - {stats_file}")
+        if recorder:
+            print(f"  - {recorder.filename}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Grabación y reproducción determinista de la carga de trabajo
+Los scripts de rendimiento graban cada operación que lanzan (instante, operación,
+endpoint, parámetros e id devuelto por el servidor) en un fichero JSON Lines
+comprimido con gzip. Ese fichero se puede reproducir contra cualquier backend
+a velocidad real (1x), acelerada o máxima, de modo que las comparaciones
+antes/después usan exactamente el mismo tráfico.
+
+La reproducción es en bucle abierto, como la grabación: cada operación se lanza
+desde un pool de hilos en su instante grabado (escalado por la velocidad), sin
+esperar a que termine la anterior. Solo espera la operación que usa el id de
+una creación que todavía no ha respondido. El retraso entre el instante
+programado y el envío real se guarda y se resume en el informe.
+
+Los ids generados por el servidor cambian de una ejecución a otra, así que el
+reproductor mantiene un mapa (tipo de entidad, id grabado) -> id nuevo a partir
+de las respuestas de las operaciones de creación. El tipo de entidad importa
+porque en Postgres posts, comentarios y reacciones tienen secuencias distintas y
+el mismo id puede pertenecer a entidades diferentes. Los ids que no aparecen en
+el mapa (por ejemplo datos precargados) se usan tal cual.
+
+Ejemplos:
+  python3 workload_trace.py replay postgres/workload_trace_20250913_155754.jsonl.gz --url http://localhost:5100
+  python3 workload_trace.py replay trace.jsonl.gz --url http://localhost:8085 --speed 10
+  python3 workload_trace.py replay trace.jsonl.gz --url http://localhost:8085 --speed max --concurrency 128
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+
+TRACE_VERSION = 1
+DEFAULT_CONCURRENCY = 64
+
+# Parámetro de ruta que identifica a la entidad creada por cada operación
+CREATED_ID_PARAMS = {
+    'INSERT_POST': 'postId',
+    'INSERT_COMMENT': 'commentId',
+    'INSERT_REACTION': 'reactionId',
+}
+
+
+class TraceRecorder:
+    """Graba las operaciones emitidas por un script de rendimiento"""
+
+    def __init__(self, filename, source, base_url, seed):
+        self.filename = filename
+        self.start = time.perf_counter()
+        self._lock = threading.Lock()   # record() se puede llamar desde varios hilos
+        self.file = gzip.open(filename, 'wt', encoding='utf-8')
+        self._write({
+            'version': TRACE_VERSION,
+            'source': source,
+            'base_url': base_url,
+            'seed': seed,
+            'started_at': datetime.now().isoformat()
+        })
+
+    def _write(self, entry):
+        line = json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + "\n"
+        with self._lock:
+            self.file.write(line)
+
+    def record(self, operation, method, path, ids=None, body=None,
+               status_code=None, resolved_id=None, issued_at=None):
+        """
+        Graba una operación. `path` es la plantilla del endpoint (p. ej.
+        "/post/{postId}/comment") e `ids` los valores de sus parámetros.
+        `resolved_id` es el id que devolvió el servidor en las creaciones e
+        `issued_at` el valor de time.perf_counter() al lanzar la petición.
+        """
+        issued_at = time.perf_counter() if issued_at is None else issued_at
+        entry = {'t': round(issued_at - self.start, 6), 'op': operation, 'method': method, 'path': path}
+        if ids:
+            entry['ids'] = {name: str(value) for name, value in ids.items()}
+        if body is not None:
+            entry['body'] = body
+        entry['status'] = status_code
+        if resolved_id is not None:
+            entry['id'] = str(resolved_id)
+        self._write(entry)
+
+    def close(self):
+        self.file.close()
+
+
+def load_trace(filename):
+    """Devuelve la cabecera y la lista de operaciones de una traza"""
+    with gzip.open(filename, 'rt', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+        if header.get('version') != TRACE_VERSION:
+            raise ValueError(f"Versión de traza no soportada: {header.get('version')}")
+        entries = [json.loads(line) for line in f if line.strip()]
+    # Con varios hilos las líneas se escriben al terminar cada petición, no al lanzarla
+    entries.sort(key=lambda entry: entry['t'])
+    return header, entries
+
+
+class TraceReplayer:
+    """Reproduce una traza contra un backend, en orden y con remapeo de ids"""
+
+    def __init__(self, base_url, speed, concurrency=DEFAULT_CONCURRENCY):
+        self.base_url = base_url
+        self.speed = speed          # None = velocidad máxima
+        self.concurrency = concurrency
+        self.id_map = {}            # (parámetro, id grabado) -> id del backend actual
+        self.results = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def session(self):
+        """Una sesión HTTP por hilo"""
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def resolve_path(self, entry):
+        ids = {name: self.id_map.get((name, value), value) for name, value in entry.get('ids', {}).items()}
+        return entry['path'].format(**ids)
+
+    def replay_operation(self, entry, operation_number, scheduled):
+        path = self.resolve_path(entry)
+        start_time = time.perf_counter()
+        status_code, error_message = None, ""
+        try:
+            response = self.session().request(entry['method'], f"{self.base_url}{path}",
+                                            json=entry.get('body'), timeout=10)
+            end_time = time.perf_counter()
+            status_code = response.status_code
+            param = CREATED_ID_PARAMS.get(entry['op'])
+            if param and 'id' in entry and response.ok:
+                new_id = response.json().get('id')
+                if new_id is not None:
+                    with self._lock:
+                        self.id_map[(param, entry['id'])] = str(new_id)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            end_time = time.perf_counter()
+            status_code = -1
+            error_message = str(e)[:100]
+
+        return {
+            'operation_type': entry['op'],
+            'operation_number': operation_number,
+            'duration_ms': (end_time - start_time) * 1000,
+            'send_lag_ms': (start_time - scheduled) * 1000,
+            'success': status_code in (200, 201),
+            'status_code': status_code,
+            'recorded_status_code': entry.get('status'),
+            'path': path,
+            'error_message': error_message,
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def run(self, entries):
+        # Operaciones de las que depende cada entrada: las creaciones cuyos ids usa
+        created = {}        # índice de la creación -> evento que se marca al responder
+        creators = {}       # (parámetro, id grabado) -> índice de la creación
+        dependencies = []
+        for i, entry in enumerate(entries):
+            dependencies.append([creators[(name, value)] for name, value in entry.get('ids', {}).items()
+                                 if (name, value) in creators])
+            param = CREATED_ID_PARAMS.get(entry['op'])
+            if param and 'id' in entry:
+                creators[(param, entry['id'])] = i
+                created[i] = threading.Event()
+
+        def task(i, entry, scheduled):
+            try:
+                # Las creaciones se envían antes (orden de la traza y cola FIFO), así que no hay interbloqueo
+                for index in dependencies[i]:
+                    created[index].wait()
+                result = self.replay_operation(entry, i + 1, scheduled)
+            finally:
+                if i in created:
+                    created[i].set()
+            with self._lock:
+                self.results.append(result)
+            print(f"  {result['operation_type']} {i+1}: {result['duration_ms']:.2f}ms - {'✓' if result['success'] else '✗'}")
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for i, entry in enumerate(entries):
+                if self.speed is None:
+                    scheduled = time.perf_counter()
+                else:
+                    # Respeta el instante grabado (escalado); si vamos retrasados se lanza ya
+                    scheduled = start + entry['t'] / self.speed
+                    delay = scheduled - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                executor.submit(task, i, entry, scheduled)
+        self.results.sort(key=lambda r: r['operation_number'])
+        return self.results
+
+    def save_csv_results(self):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"replay_results_{timestamp}.csv"
+        fieldnames = ['operation_type', 'operation_number', 'duration_ms', 'send_lag_ms', 'success', 'status_code',
+                      'recorded_status_code', 'path', 'error_message', 'timestamp']
+        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer.writeheader()
+            for result in self.results:
+                writer.writerow(result)
+        return filename
+
+    def save_statistics(self, trace_file, header):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"replay_statistics_{timestamp}.txt"
+        operations = list(dict.fromkeys(r['operation_type'] for r in self.results))
+
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write("=" * 60 + "\n")
+            f.write("ESTADÍSTICAS DE REPRODUCCIÓN DE TRAZA - APLICACIÓN CQRS\n")
+            f.write("=" * 60 + "\n")
+            f.write(f"Fecha y hora: {datetime.now()}\n")
+            f.write(f"Traza: {trace_file} (origen {header.get('source')}, semilla {header.get('seed')})\n")
+            f.write(f"URL base: {self.base_url}\n")
+            f.write(f"Velocidad: {'máxima' if self.speed is None else f'{self.speed:g}x'}\n")
+            f.write(f"Concurrencia máxima: {self.concurrency}\n")
+            lags = [r['send_lag_ms'] for r in self.results]
+            if lags:
+                f.write(f"Retraso de envío sobre el instante programado: medio {statistics.mean(lags):.2f} ms, "
+                        f"p99 {self.percentile(lags, 99):.2f} ms, máximo {max(lags):.2f} ms\n")
+            f.write("\n")
+
+            for operation in operations:
+                results = [r for r in self.results if r['operation_type'] == operation]
+                times = [r['duration_ms'] for r in results if r['success']]
+                f.write(f"{operation}:\n")
+                f.write("-" * (len(operation) + 1) + "\n")
+                f.write(f"Operaciones exitosas: {len(times)}/{len(results)}\n")
+                if times:
+                    f.write(f"Tiempo promedio: {statistics.mean(times):.2f} ms\n")
+                    f.write(f"Mediana: {statistics.median(times):.2f} ms\n")
+                    if len(times) > 1:
+                        percentiles = statistics.quantiles(times, n=100, method="inclusive")
+                        f.write(f"Percentil 95: {percentiles[94]:.2f} ms\n")
+                        f.write(f"Percentil 99: {percentiles[98]:.2f} ms\n")
+                    f.write(f"Tiempo máximo: {max(times):.2f} ms\n")
+                lags = [r['send_lag_ms'] for r in results]
+                f.write(f"Retraso de envío medio / máximo: {statistics.mean(lags):.2f} / {max(lags):.2f} ms\n")
+                f.write("\n")
+
+        return filename
+
+    @staticmethod
+    def percentile(values, p):
+        if len(values) == 1:
+            return values[0]
+        return statistics.quantiles(values, n=100, method="inclusive")[p - 1]
+
+
+def parse_speed(value):
+    if value == "max":
+        return None
+    speed = float(value)
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("La velocidad debe ser positiva o 'max'")
+    return speed
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("Debe ser un entero mayor o igual que 1")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reproducción de trazas de carga de trabajo")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    replay = subparsers.add_parser("replay", help="Reproduce una traza contra un backend")
+    replay.add_argument("trace", help="Fichero de traza (.jsonl.gz)")
+    replay.add_argument("--url", help="URL base (por defecto la grabada en la traza)")
+    replay.add_argument("--speed", type=parse_speed, default=1.0,
+                        help="Factor de velocidad (1 = tiempo real, 10 = 10x) o 'max'")
+    replay.add_argument("--concurrency", type=positive_int, default=DEFAULT_CONCURRENCY,
+                        help="Peticiones en vuelo como máximo")
+    args = parser.parse_args()
+
+    header, entries = load_trace(args.trace)
+    base_url = args.url or header['base_url']
+    print(f"▶️  Reproduciendo {len(entries)} operaciones de {args.trace} contra {base_url}")
+
+    replayer = TraceReplayer(base_url, args.speed, args.concurrency)
+    try:
+        replayer.run(entries)
+    except KeyboardInterrupt:
+        print("\n⏹️  Reproducción interrumpida por el usuario")
+
+    if replayer.results:
+        lags = [r['send_lag_ms'] for r in replayer.results]
+        print(f"\nRetraso de envío sobre el instante programado: medio {statistics.mean(lags):.2f} ms, "
+              f"máximo {max(lags):.2f} ms")
+    csv_file = replayer.save_csv_results()
+    stats_file = replayer.save_statistics(args.trace, header)
+    print(f"\n✅ Reproducción completada\nArchivos generados:\n  - {csv_file}\n  - {stats_file}")
+
+
+if __name__ == "__main__":
+    main()